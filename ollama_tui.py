@@ -22,6 +22,8 @@ class OllamaTUI(App):
     def on_input_submitted(self, event: Input.Submitted) -> None:
         """Handle user input submission."""
         user_message = event.value
+        if not user_message.strip():
+            return
         self.query_one("#user_input", Input).value = ""
         self.query_one("#response_area", TextArea).load_text(f"User: {user_message}\n")
 
@@ -32,13 +34,11 @@ class OllamaTUI(App):
                 messages=[{'role': 'user', 'content': user_message}],
                 stream=True,
             )
-            response_text = ""
+            response_area = self.query_one("#response_area", TextArea)
             for chunk in stream:
                 if 'content' in chunk['message']:
-                    response_text += chunk['message']['content']
-                    self.query_one("#response_area", TextArea).load_text(
-                        self.query_one("#response_area", TextArea).text + chunk['message']['content']
-                    )
+                    # Append each chunk at the end instead of reloading the whole text.
+                    response_area.insert(chunk['message']['content'], response_area.document.end)
         except Exception as e:
             self.query_one("#response_area", TextArea).load_text(f"Error: {e}")
 